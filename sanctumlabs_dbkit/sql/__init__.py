@@ -16,8 +16,12 @@ from sanctumlabs_dbkit.sql.models import BaseModel
 from sanctumlabs_dbkit.protocols import User
 from sanctumlabs_dbkit.utils import set_updated_by
 
-# sets defaults for columns in the models on instantiation
-force_instant_defaults()
+# sets defaults for columns in the models on instantiation. The call monkey-patches SQLAlchemy globally, so
+# it is guarded by a sentinel on the function itself to ensure we only patch once per process, even if
+# other packages (or future submodules) invoke it again.
+if not getattr(force_instant_defaults, "_dbkit_applied", False):
+    force_instant_defaults()
+    setattr(force_instant_defaults, "_dbkit_applied", True)
 
 
 @event.listens_for(SessionLocal, "after_commit")
@@ -30,10 +34,15 @@ def process_hooks(current_session: Session) -> None:
             List[CommitCallback], current_session.info.get("on_commit_hooks", [])
         )
 
-        while hooks:
-            fn = hooks.pop(0)
+        # Iterate forwards and clear afterwards rather than draining with
+        # `hooks.pop(0)`, which shifts the backing array on every call and
+        # makes processing N hooks O(N^2). Hooks registered while the loop
+        # runs are still picked up and fire exactly once.
+        for fn in hooks:
             fn(current_session)
 
+        hooks.clear()
+
 
 @event.listens_for(SessionLocal, "after_transaction_end")
 def remove_remaining_hooks(
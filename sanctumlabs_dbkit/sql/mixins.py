@@ -2,10 +2,10 @@
 Contains mixins that can be included in classes to add more functionality
 """
 
-from typing import Optional
+from typing import Any, Optional, Tuple
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
-from sqlalchemy import DateTime, func, BIGINT, Identity
+from sqlalchemy import DateTime, func, BIGINT, Identity, Index, column
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, declared_attr
 from sqlalchemy.dialects.postgresql import UUID as UUIDType
 import inflection
@@ -67,6 +67,38 @@ class SoftDeletedMixin:
         """Returns the date of the deleted record"""
         return mapped_column(DateTime(timezone=True), default=self.not_deleted_value())
 
+    @declared_attr.directive
+    def __table_args__(cls) -> Tuple[Any, ...]:  # pylint: disable=no-self-argument
+        """A composite index on (deleted_at, created_at) supporting the 'not deleted' predicate that
+        `Repository.query` appends to every read, and the `ORDER BY created_at DESC` used by
+        `Repository.list`. On PostgreSQL the index is partial, covering only live rows, so it stays small
+        no matter how many soft-deleted rows accumulate. Models declaring their own `__table_args__`
+        override this and should re-add the index if they rely on soft-deleted reads.
+
+        The mixin is usable on its own, without `TimestampColumnsMixin`, in which case the index only
+        covers `deleted_at`.
+        """
+        deleted_at = column("deleted_at", DateTime(timezone=True))
+        not_deleted = cls.not_deleted_value()
+
+        index_columns = (
+            ("deleted_at", "created_at")
+            if hasattr(cls, "created_at")
+            else ("deleted_at",)
+        )
+
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_not_deleted",  # type: ignore[attr-defined]
+                *index_columns,
+                postgresql_where=(
+                    deleted_at.is_(None)
+                    if not_deleted is None
+                    else deleted_at == not_deleted
+                ),
+            ),
+        )
+
 
 class AuditedMixin:
     """
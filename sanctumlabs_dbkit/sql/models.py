@@ -31,6 +31,11 @@ class AbstractBaseModel(
 
     __abstract__ = True
 
+    # Fetch server-generated defaults (e.g. created_at) with RETURNING on the INSERT itself, rather than
+    # requiring a follow-up SELECT. Dialects without RETURNING support fall back to an immediate
+    # post-INSERT SELECT, which costs no more than the explicit refresh it replaces.
+    __mapper_args__ = {"eager_defaults": True}
+
     pk: str = "uuid"
 
 
@@ -55,10 +60,26 @@ class BaseOutboxEvent(Base, BigIntIdentityMixin, TableNameMixin):
             ...
         ),
     )
+
+    Outbox events are typically written in high-volume batches. Rather than looping over `session.add(...)`
+    and paying a round-trip per event, publishers should drain pending events through the batched insert
+    path so a single multi-row statement is emitted per batch:
+
+    ```python
+    outbox_repository = Repository(model=MyOutboxEvent, session=session)
+    outbox_repository.bulk_create(pending_events)
+    ```
+
+    On PostgreSQL with psycopg2, the batching can be tuned further on the engine with
+    `create_engine(..., executemany_mode="values_plus_batch", insertmanyvalues_page_size=1000)` so the
+    driver's fast execution helpers are used for the executemany calls. Column defaults (`uuid`, `created`)
+    are still applied per row on this path.
     """
 
     __abstract__ = True
 
+    __mapper_args__ = {"eager_defaults": True}
+
     uuid: Mapped[UUID] = mapped_column(unique=True, default=uuid4)
 
     created: Mapped[datetime] = mapped_column(
@@ -3,9 +3,13 @@ Contains a generic base repository or DAO for access patterns to data for a give
 """
 
 from datetime import datetime, UTC
+from itertools import islice
 from typing import (
     Generic,
     Any,
+    Dict,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
     Type,
@@ -14,9 +18,10 @@ from typing import (
     TypeGuard,
     Union,
 )
-from sqlalchemy import ColumnElement, Select, select
+from sqlalchemy import ColumnElement, CursorResult, Select, insert, select, update
 
 from sanctumlabs_dbkit.exceptions import ModelNotFoundError
+from sanctumlabs_dbkit.protocols import User
 from sanctumlabs_dbkit.sql.models import AbstractBaseModel, BaseOutboxEvent
 from sanctumlabs_dbkit.sql.session import Session
 from sanctumlabs_dbkit.exceptions import UnsupportedModelOperationError
@@ -41,6 +46,23 @@ class Repository(Generic[T]):
         self.model = model
         self.session = session
 
+        # Select statements are immutable (chaining .where()/.limit() returns new statements), so the two
+        # query variants, the primary key column and the soft-deletion introspection are all resolved once
+        # here rather than being recomputed on every call to `query`/`find`/`delete`.
+        self._pk_column = cast(ColumnElement, getattr(model, model.pk))
+        self._select = select(model)
+
+        if self._supports_soft_deletion(model):
+            self._soft_delete = True
+            self._not_deleted_value = model.not_deleted_value()
+            self._select_not_deleted = self._select.where(
+                model.deleted_at == self._not_deleted_value
+            )
+        else:
+            self._soft_delete = False
+            self._not_deleted_value = None
+            self._select_not_deleted = self._select
+
     @staticmethod
     def _supports_soft_deletion(model: Type[T]) -> TypeGuard[Type[AbstractBaseModel]]:
         """
@@ -62,27 +84,40 @@ class Repository(Generic[T]):
         self.session.add(model_instance)
 
         if refresh:
+            # The flush alone is enough to populate server-generated defaults: the base models map with
+            # eager_defaults, so the INSERT carries a RETURNING clause (or an immediate follow-up SELECT on
+            # dialects without RETURNING). An explicit session.refresh here would be a redundant SELECT.
             self.session.flush()
-            self.session.refresh(model_instance)
 
         return cast(T, model_instance)
 
-    def query(self, include_deleted: bool = False) -> Select:
-        """Returns a select query with the model including deleted records if the include_deleted is set to True"""
-        selectable = select(self.model)
+    def bulk_create(
+        self, values: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> None:
+        """Creates multiple entities using batched INSERT statements.
 
-        if not include_deleted and self._supports_soft_deletion(self.model):
-            selectable = selectable.where(
-                self.model.deleted_at == self.model.not_deleted_value()
-            )
+        Rows are pulled from `values` in chunks of `batch_size` and each chunk is written with a single
+        executemany-style statement, letting the driver's fast path (e.g. psycopg2 fast execution helpers /
+        SQLAlchemy's insertmanyvalues) batch rows instead of paying a round-trip per row. The iterable is
+        never fully materialized, so a generator can safely be passed when ingesting large datasets.
+
+        Args:
+            values: mappings of column names to values, one mapping per row.
+            batch_size (int, optional): number of rows to insert per statement. Defaults to 1000. Callers
+                can tune this per dialect (e.g. lower for drivers with parameter limits).
+        """
+        rows = iter(values)
+
+        while chunk := list(islice(rows, batch_size)):
+            self.session.execute(insert(self.model), chunk)
 
-        return selectable
+    def query(self, include_deleted: bool = False) -> Select:
+        """Returns a select query with the model including deleted records if the include_deleted is set to True"""
+        return self._select if include_deleted else self._select_not_deleted
 
     def find(self, pk: Any, include_deleted: bool = False) -> Optional[T]:
         """Retrieve a given model given its primary key"""
-        pk_column = cast(ColumnElement, getattr(self.model, self.model.pk))
-
-        statement = self.query(include_deleted).where(pk_column == pk).limit(1)
+        statement = self.query(include_deleted).where(self._pk_column == pk).limit(1)
 
         return self.session.scalars(statement).first()
 
@@ -103,19 +138,94 @@ class Repository(Generic[T]):
 
         return self.session.scalars(statement).all()
 
+    def iter_all(
+        self, batch_size: int = 1000, include_deleted: bool = False
+    ) -> Iterator[T]:
+        """Iterates over all records for the given model, streaming results from the database.
+
+        Unlike `all`, which materializes the entire result set in memory before returning, records are
+        fetched in batches of `batch_size` (via SQLAlchemy's `yield_per`, using a server-side cursor on
+        dialects that support one), so peak memory is bounded to a single batch. Useful for large tables
+        such as outbox or audit logs.
+
+        Args:
+            batch_size (int, optional): number of records to fetch per round-trip. Defaults to 1000.
+            include_deleted (bool, optional): whether to include soft deleted records. Defaults to False.
+        """
+        statement = self.query(include_deleted).execution_options(yield_per=batch_size)
+
+        yield from self.session.scalars(statement)
+
+    def _soft_delete_values(self) -> Dict[str, Any]:
+        """The values applied by the soft-deletion UPDATEs. Because the direct UPDATE bypasses the unit
+        of work, the `before_flush` auditing hook never sees the entity, so `updated_by` is stamped here
+        whenever the session carries auth, mirroring the hook's behavior.
+        """
+        values: Dict[str, Any] = {"deleted_at": datetime.now(UTC)}
+
+        if hasattr(self.session, "auth"):
+            user = cast(Optional[User], self.session.auth)
+            values["updated_by"] = user.user_uuid if user else None
+
+        return values
+
     def delete(self, pk: Any) -> None:
-        """Deletes a given record with the given primary key"""
-        if not self._supports_soft_deletion(self.model):
+        """Deletes a given record with the given primary key.
+
+        The deletion is issued as a single UPDATE against the primary key rather than fetching and
+        hydrating the full row first, so no wasted round-trip or identity-map load is paid just to set
+        `deleted_at`. Records that are already soft deleted are left untouched. When the session carries
+        auth, `updated_by` is stamped as part of the same UPDATE.
+        """
+        if not self._soft_delete:
             raise UnsupportedModelOperationError(
                 f"The model {self.model.__name__} {pk} does not support soft deletion."
             )
 
-        # Cast here as mypy type narrowing doesn't infer the type of entity
-        # correctly
-        entity = cast(AbstractBaseModel, self.find(pk))
+        # Cast here as mypy can't narrow the model type from the cached boolean
+        model = cast(Type[AbstractBaseModel], self.model)
+
+        self.session.execute(
+            update(model)
+            .where(
+                self._pk_column == pk,
+                model.deleted_at == self._not_deleted_value,
+            )
+            .values(**self._soft_delete_values())
+        )
+
+    def bulk_delete(self, pks: Sequence[Any]) -> int:
+        """Soft deletes all records with the given primary keys in a single UPDATE statement. When the
+        session carries auth, `updated_by` is stamped as part of the same UPDATE.
+
+        Returns:
+            int: the number of records that were marked as deleted. Records that were already soft
+                deleted (or primary keys that don't exist) are not counted.
+        """
+        if not self._soft_delete:
+            raise UnsupportedModelOperationError(
+                f"The model {self.model.__name__} does not support soft deletion."
+            )
+
+        if not pks:
+            return 0
+
+        # Cast here as mypy can't narrow the model type from the cached boolean
+        model = cast(Type[AbstractBaseModel], self.model)
+
+        result = cast(
+            CursorResult,
+            self.session.execute(
+                update(model)
+                .where(
+                    self._pk_column.in_(pks),
+                    model.deleted_at == self._not_deleted_value,
+                )
+                .values(**self._soft_delete_values())
+            ),
+        )
 
-        if entity:
-            entity.deleted_at = datetime.now(UTC)
+        return result.rowcount
 
     def list(
         self, limit: int = 20, offset: int = 0, include_deleted: bool = False
@@ -0,0 +1,45 @@
+"""
+JSON codec helpers for SQLAlchemy engines
+"""
+
+from decimal import Decimal
+from typing import Any, Union
+
+import orjson
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for the types orjson doesn't handle natively that appear in pydantic column data"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        # Decimals stay numeric on the wire, matching how they serialized before the orjson swap;
+        # pydantic coerces the float back to the same Decimal when the column is read.
+        return float(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_serializer(value: Any) -> str:
+    """Serializes a value to a JSON string using orjson.
+
+    SQLAlchemy's JSON/JSONB columns serialize through the stdlib `json` module by default, which is both
+    slow and unable to handle the dates, UUIDs and decimals that pydantic model dumps contain. Configure
+    the engine with this serializer so every JSON column (including the pydantic column types in
+    `sanctumlabs_dbkit.sql.types`) goes through orjson instead:
+
+    ```python
+    engine = create_engine(
+        database_url,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
+    )
+    ```
+    """
+    return orjson.dumps(value, default=_default).decode()
+
+
+def json_deserializer(value: Union[str, bytes]) -> Any:
+    """Deserializes a JSON string using orjson. The read-side counterpart to `json_serializer`"""
+    return orjson.loads(value)
@@ -4,10 +4,14 @@ Database Kit Types
 
 from __future__ import annotations
 
+from datetime import date
+from functools import lru_cache
+from uuid import UUID
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -19,7 +23,7 @@ from typing import (
 )
 
 import sqlalchemy as sa
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy import Dialect
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import Mutable, MutableList
@@ -33,6 +37,41 @@ CommitCallback = Callable[[Session], None]
 _T = TypeVar("_T", bound=BaseModel)
 
 
+_UNSET = object()
+
+# Types for which equality implies an identical serialized representation, used to elide no-op
+# attribute writes. float, Decimal and datetime are deliberately excluded: values that compare equal
+# can still serialize differently (-0.0 == 0.0, Decimal("1") == Decimal("1.0"), and tz-aware
+# datetimes compare equal across offsets). Membership is checked by exact type, so subclasses (such
+# as datetime under date) don't inherit the elision.
+_EQUALITY_SAFE_TYPES = (str, int, bool, date, UUID, type(None))
+
+
+@lru_cache(maxsize=None)
+def _model_field_names(model_cls: Type[BaseModel]) -> FrozenSet[str]:
+    """Returns the field names for a pydantic model class, cached per class"""
+    return frozenset(model_cls.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(model_cls: Any) -> TypeAdapter[Any]:
+    """Returns the TypeAdapter for a pydantic model class, shared across all column instances.
+
+    Every adapter owns a pydantic-core validator/serializer pair, which is the expensive part of a
+    column declaration; multiple columns declared against the same model (across tables, or across
+    repeated declarative configuration) now share one instead of each building their own. Dump
+    options such as `exclude_defaults` are passed per call, so the cache only needs to key on the
+    model class.
+    """
+    return TypeAdapter(model_cls)
+
+
+@lru_cache(maxsize=None)
+def _list_type_adapter(model_cls: Any) -> TypeAdapter[Any]:
+    """Returns the TypeAdapter for a list of a pydantic model class, shared like `_type_adapter`"""
+    return TypeAdapter(List[model_cls])
+
+
 class SerializationOptions(BaseModel):
     """
     `SerializationOptions` are used when serialization a pydantic model to JSON.
@@ -50,9 +89,16 @@ class SerializationOptions(BaseModel):
 
     Given the above example, when the settings data is serialized and persisted in the database, it will not dump
     the default model values.
+
+    Setting `trust_db=True` skips pydantic validation when deserializing a column value and constructs the
+    model directly with `model_construct`. This avoids the full validation cost on every row read and is safe
+    when the column is only ever written through this library (the data was validated on the way in). Note
+    that `model_construct` does not coerce types or recurse into nested models, so it should only be enabled
+    for flat models whose dumped representation matches the field types.
     """
 
     exclude_defaults: bool = False
+    trust_db: bool = False
 
 
 # pylint: disable=abstract-method,too-many-ancestors
@@ -72,6 +118,12 @@ class ColumnUsesPydanticModelsMixin(sa.types.TypeDecorator, TypeEngine[_T]):
         self.model = model
         self.serialization_options = serialization_options or SerializationOptions()
 
+        # The adapter and dump options are resolved once per column rather than per row; calling
+        # model_dump/model_validate on every load/store re-resolves the schema and rebuilds the
+        # keyword arguments each time.
+        self._adapter: TypeAdapter[Any] = _type_adapter(model)
+        self._exclude_defaults = self.serialization_options.exclude_defaults
+
         super().__init__()
 
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
@@ -81,8 +133,20 @@ class ColumnUsesPydanticModelsMixin(sa.types.TypeDecorator, TypeEngine[_T]):
         return dialect.type_descriptor(sa.JSON(none_as_null=True))
 
     def _model_to_dict(self, value: _T) -> Dict[str, Any]:
-        return value.model_dump(
-            exclude_defaults=self.serialization_options.exclude_defaults
+        # The adapter serializes against the concrete model class, so mutable wrappers and proxied
+        # instances are unwrapped down to the underlying pydantic model before dumping.
+        if isinstance(value, MutablePydanticModel):
+            value = value.proxied_model_instance  # type: ignore[unreachable]
+
+        model_instance = (
+            value.__wrapped__ if isinstance(value, PydanticModelProxy) else value
+        )
+
+        return cast(
+            Dict[str, Any],
+            self._adapter.dump_python(
+                model_instance, exclude_defaults=self._exclude_defaults
+            ),
         )
 
 
@@ -98,18 +162,32 @@ class PydanticModel(ColumnUsesPydanticModelsMixin):
     """
 
     def process_bind_param(
-        self, value: Optional[BaseModel], dialect: Dialect
+        self, value: Optional[Union[BaseModel, MutablePydanticModel]], dialect: Dialect
     ) -> Optional[Dict[str, Any]]:
-        return self._model_to_dict(value) if value else None
+        if not value:
+            return None
+
+        # For mutable models we cache the serialized dict on the mutable itself so that flushing an
+        # unchanged model (the common "read, write back" pattern) doesn't re-run the pydantic dump. The
+        # cache is invalidated whenever the mutable signals a change.
+        if isinstance(value, MutablePydanticModel):
+            # pylint: disable=protected-access
+            if value._cached_dump is None:
+                value._cached_dump = self._model_to_dict(value)
+            return value._cached_dump
+
+        return self._model_to_dict(value)
 
     def process_result_value(
         self, value: Optional[Any], dialect: Dialect
     ) -> Optional[BaseModel]:
-        return (
-            cast(BaseModel, self.model.model_validate(value))
-            if value is not None
-            else None
-        )
+        if value is None:
+            return None
+
+        if self.serialization_options.trust_db:
+            return cast(BaseModel, self.model.model_construct(**value))
+
+        return cast(BaseModel, self._adapter.validate_python(value))
 
     def __repr__(self) -> str:
         return f"PydanticModel{self.model.__name__}"
@@ -129,12 +207,32 @@ class PydanticModelProxy(ObjectProxy):  # type: ignore[misc]
         super().__init__(wrapped)
 
         self._self_mutable = mutable
+        self._self_field_names = _model_field_names(type(wrapped))
 
     def __setattr__(self, name: str, value: Any) -> None:
+        # The field names are precomputed at construction time; resolving model_fields through the proxy
+        # on every attribute write pays an extra attribute chain across the wrapt boundary. The default
+        # guards against the writes wrapt itself performs before __init__ has stored the field names.
+        if name not in getattr(self, "_self_field_names", ()):
+            super().__setattr__(name, value)
+            return
+
+        previous = getattr(self.__wrapped__, name, _UNSET)
+
         super().__setattr__(name, value)
 
-        if name in self.__wrapped__.model_fields:
-            self._self_mutable.changed()
+        # Assigning a value equal to the current one is elided so that no-op writes don't flag the
+        # attribute as modified and force an UPDATE on flush. Restricted to types where equality is
+        # cheap and implies an identical serialized form; everything else (mutable containers, nested
+        # models, floats, decimals) falls through and triggers the change unconditionally.
+        if (
+            type(previous) is type(value)
+            and type(value) in _EQUALITY_SAFE_TYPES
+            and previous == value
+        ):
+            return
+
+        self._self_mutable.changed()
 
 
 class MutablePydanticModel(Mutable):
@@ -151,10 +249,17 @@ class MutablePydanticModel(Mutable):
     """
 
     def __init__(self, model_instance: BaseModel):
+        self._cached_dump: Optional[Dict[str, Any]] = None
         self.proxied_model_instance = _create_proxied_pydantic_model(
             model_instance, self
         )
 
+    def changed(self) -> None:
+        """Invalidates the cached serialized dict before propagating the change event"""
+        self._cached_dump = None
+
+        super().changed()
+
     @classmethod
     def as_mutable(
         cls, sqltype: Union[TypeEngine[_T], _T], **kwargs: Any
@@ -175,7 +280,7 @@ class MutablePydanticModel(Mutable):
         return value
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name == "proxied_model_instance":
+        if name in ("proxied_model_instance", "_cached_dump"):
             super().__setattr__(name, value)
         else:
             setattr(self.proxied_model_instance, name, value)
@@ -194,19 +299,45 @@ class PydanticModelList(ColumnUsesPydanticModelsMixin):
     `products: Mapped[List[Product]] = mapped_column(PydanticModelList(Product))`
     """
 
+    def __init__(
+        self, model: Any, serialization_options: Optional[SerializationOptions] = None
+    ):
+        super().__init__(model, serialization_options)
+
+        # A list-level adapter dumps the whole list in a single pydantic-core call rather than paying a
+        # Python-to-Rust transition per element.
+        self._list_adapter: TypeAdapter[Any] = _list_type_adapter(model)
+
     def process_bind_param(
         self, value: Optional[List[BaseModel]], dialect: Dialect
     ) -> Optional[List[Dict[str, Any]]]:
-        if value:
-            return [self._model_to_dict(model_instance) for model_instance in value]
-        return None
+        if not value:
+            return None
+
+        model_instances = [
+            v.__wrapped__ if isinstance(v, PydanticModelProxy) else v  # type: ignore[unreachable]
+            for v in value
+        ]
+
+        return cast(
+            List[Dict[str, Any]],
+            self._list_adapter.dump_python(
+                model_instances, exclude_defaults=self._exclude_defaults
+            ),
+        )
 
     def process_result_value(
         self, value: Optional[Any], dialect: Dialect
     ) -> Optional[List[BaseModel]]:
-        if value:
-            return [self.model.model_validate(model_data) for model_data in value]
-        return None
+        if not value:
+            return None
+
+        # As with PydanticModel, trusted reads skip validation and construct the models directly. The
+        # same flat-model caveats documented on SerializationOptions.trust_db apply to each element.
+        if self.serialization_options.trust_db:
+            return [self.model.model_construct(**model_data) for model_data in value]
+
+        return [self.model.model_validate(model_data) for model_data in value]
 
 
 class MutablePydanticModelList(MutableList):
@@ -2,14 +2,24 @@
 Database Kit SQL Utilities
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import inspect
-from sqlalchemy.orm import InstanceState, PassiveFlag
+from sqlalchemy.orm import InstanceState, Mapper, PassiveFlag
 
 from sanctumlabs_dbkit.sql.models import AbstractBaseModel
 
 
+@lru_cache(maxsize=None)
+def _attribute_keys(mapper: Mapper) -> Tuple[str, ...]:
+    """Returns the attribute keys for a mapper, cached per mapper. Iterating `state.attrs` builds a fresh
+    namespace of attribute objects on every call, which is wasted work for change inspection where only
+    the keys are needed.
+    """
+    return tuple(attr.key for attr in mapper.attrs)
+
+
 def get_changes(entity: AbstractBaseModel) -> Dict[str, Tuple[Any, Any]]:
     """
     Return a dictionary containing changes made to the model since it was
@@ -31,15 +41,15 @@ def get_changes(entity: AbstractBaseModel) -> Dict[str, Tuple[Any, Any]]:
 
     changes: Dict[str, Tuple[Any, Any]] = {}
 
-    for attr in state.attrs:
-        hist = state.get_history(attr.key, PassiveFlag.PASSIVE_OFF)
+    for key in _attribute_keys(state.mapper):
+        hist = state.get_history(key, PassiveFlag.PASSIVE_OFF)
 
         if not hist.has_changes():
             continue
 
         old_value = hist.deleted[0] if hist.deleted else None
         new_value = hist.added[0] if hist.added else None
-        changes[attr.key] = (old_value, new_value)
+        changes[key] = (old_value, new_value)
 
     return changes
 
@@ -50,7 +60,15 @@ def has_changed(entity: AbstractBaseModel, key: Optional[str] = None) -> bool:
     fetched from the database. In the case of a nested transaction, only changes from the most recent savepoint
     will reflect.
     """
-    return has_any_changed(entity, [key]) if key else len(get_changes(entity)) > 0
+    if key:
+        return has_any_changed(entity, [key])
+
+    state: InstanceState = inspect(entity)
+
+    return any(
+        state.get_history(attr_key, PassiveFlag.PASSIVE_OFF).has_changes()
+        for attr_key in _attribute_keys(state.mapper)
+    )
 
 
 def has_any_changed(entity: AbstractBaseModel, keys: List[str]) -> bool:
@@ -58,10 +76,15 @@ def has_any_changed(entity: AbstractBaseModel, keys: List[str]) -> bool:
     Returns a boolean indicating if any attributes on `entity` have changed since it was
     fetched from the database. In the case of a nested transaction, only changes from the most recent savepoint
     will reflect.
-    """
-    changes = get_changes(entity)
-    changed_keys = changes.keys()
 
-    intersected_keys = list(set(changed_keys) & set(keys))
+    The check short-circuits on the first changed attribute rather than collecting the full change set
+    first. Keys that aren't mapped attributes are ignored, as before.
+    """
+    state: InstanceState = inspect(entity)
+    tracked_keys = _attribute_keys(state.mapper)
 
-    return len(intersected_keys) > 0
+    return any(
+        state.get_history(key, PassiveFlag.PASSIVE_OFF).has_changes()
+        for key in keys
+        if key in tracked_keys
+    )
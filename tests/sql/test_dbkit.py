@@ -216,6 +216,42 @@ def test_begin_automatically_starts_a_nested_transaction_if_within_a_transaction
     assert inspect(user).persistent  # type: ignore[union-attr]
 
 
+def test_begin_fast_joins_the_enclosing_transaction_without_a_savepoint(
+    database_session: Session,
+) -> None:
+    user1 = User(
+        uuid=UUID("91cb328e-7152-476c-9496-a63c87014d52"),
+        first_name="Bob",
+        last_name="Saget",
+        email="foo@example.org",
+    )
+
+    user2 = User(
+        uuid=UUID("82f9e42d-ee3c-46f7-b57c-d5fb7719bca1"),
+        first_name="John",
+        last_name="Doe",
+        email="john@doe.com",
+    )
+
+    with database_session.begin():
+        database_session.add(user1)
+
+        with database_session.begin_fast():
+            database_session.add(user2)
+
+            assert not database_session.in_nested_transaction()
+
+    assert not database_session.in_transaction()
+
+    user_dao = Repository(model=User, session=database_session)
+
+    user = user_dao.find("91cb328e-7152-476c-9496-a63c87014d52")
+    assert inspect(user).persistent  # type: ignore[union-attr]
+
+    user = user_dao.find("82f9e42d-ee3c-46f7-b57c-d5fb7719bca1")
+    assert inspect(user).persistent  # type: ignore[union-attr]
+
+
 def test_transaction_decorator_pattern1(database_session: Session) -> None:
     user1 = User(
         uuid=UUID("91cb328e-7152-476c-9496-a63c87014d52"),
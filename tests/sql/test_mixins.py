@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
 
+from sqlalchemy import inspect
+
 from tests.sql import Card, User
 from sanctumlabs_dbkit.sql.repository import Repository
 from sanctumlabs_dbkit.sql.session import Session
@@ -24,3 +26,15 @@ def test_soft_deleted_mixin_defaults_to_timestamp_deleted_at(
     user = user_repo.find_or_raise("45a09352-4af5-4e46-a20e-29640cfd73dd")
 
     assert user.deleted_at == datetime(1970, 1, 1, 0, 0, 1, 0, timezone.utc)
+
+
+def test_soft_deleted_mixin_creates_not_deleted_index(
+    database_session: Session,
+) -> None:
+    indexes = inspect(database_session.get_bind()).get_indexes("businesses")
+
+    index = next(
+        index for index in indexes if index["name"] == "ix_businesses_not_deleted"
+    )
+
+    assert index["column_names"] == ["deleted_at", "created_at"]
@@ -1,11 +1,59 @@
 import pytest
 
-from tests.sql import Card, User
+from tests.sql import AdminUser, Card, User
 from sanctumlabs_dbkit.sql.repository import Repository
 from sanctumlabs_dbkit.exceptions import ModelNotFoundError
 from sanctumlabs_dbkit.sql.session import Session
 
 
+def test_create_with_refresh_populates_server_defaults(
+    database_session: Session,
+) -> None:
+    user_dao = Repository(model=User, session=database_session)
+
+    user = user_dao.create(
+        refresh=True,
+        first_name="Elliot",
+        last_name="Alderson",
+        email="elliot.alderson@sanctumlabs.com",
+    )
+
+    assert isinstance(user, User)
+    assert user.uuid is not None
+    assert user.created_at is not None
+
+
+def test_bulk_create(database_session: Session) -> None:
+    user_dao = Repository(model=User, session=database_session)
+
+    user_dao.bulk_create(
+        [
+            {
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "email": "ada.lovelace@sanctumlabs.com",
+            },
+            {
+                "first_name": "Grace",
+                "last_name": "Hopper",
+                "email": "grace.hopper@sanctumlabs.com",
+            },
+        ],
+        batch_size=1,
+    )
+
+    user = database_session.execute(
+        user_dao.query().where(User.email == "ada.lovelace@sanctumlabs.com")
+    ).scalar_one()
+
+    assert isinstance(user, User)
+    assert user.first_name == "Ada"
+
+    users = user_dao.all()
+
+    assert len(users) == 4
+
+
 def test_query(database_session: Session) -> None:
     user_dao = Repository(model=User, session=database_session)
 
@@ -175,6 +223,78 @@ def test_delete(database_session: Session) -> None:
     assert user is None
 
 
+def test_delete_stamps_updated_by_when_session_has_auth(
+    database_session: Session,
+) -> None:
+    setattr(
+        database_session,
+        "auth",
+        AdminUser(user_uuid="685f423f-2cb1-48d1-a36b-c78fe28f9a14"),
+    )
+
+    user_dao = Repository(model=User, session=database_session)
+
+    user = database_session.execute(
+        user_dao.query().where(User.email == "j.doe@sanctumlabs.com")
+    ).scalar_one()
+
+    user_dao.delete(user.uuid)
+
+    # The direct UPDATE bypasses the identity map, so expire the stale instance before re-reading
+    database_session.expire(user)
+
+    deleted_user = database_session.execute(
+        user_dao.query(include_deleted=True).where(
+            User.email == "j.doe@sanctumlabs.com"
+        )
+    ).scalar_one()
+
+    assert deleted_user.deleted_at != User.not_deleted_value()
+    assert deleted_user.updated_by == "685f423f-2cb1-48d1-a36b-c78fe28f9a14"
+
+
+def test_iter_all(database_session: Session) -> None:
+    user_dao = Repository(model=User, session=database_session)
+
+    users = list(user_dao.iter_all(batch_size=1))
+
+    assert len(users) == 2
+
+    user1 = users[0]
+    assert isinstance(user1, User)
+    assert user1.email == "j.doe@sanctumlabs.com"
+
+    user2 = users[1]
+    assert isinstance(user2, User)
+    assert user2.email == "jane.doe@sanctumlabs.com"
+
+
+def test_iter_all_returns_deleted_when_include_deleted_is_true(
+    database_session: Session,
+) -> None:
+    user_dao = Repository(model=User, session=database_session)
+
+    users = list(user_dao.iter_all(include_deleted=True))
+
+    assert len(users) == 3
+
+
+def test_bulk_delete(database_session: Session) -> None:
+    user_dao = Repository(model=User, session=database_session)
+
+    users = user_dao.all()
+
+    assert len(users) == 2
+
+    deleted_count = user_dao.bulk_delete([user.uuid for user in users])
+
+    assert deleted_count == 2
+    assert user_dao.all() == []
+
+    # Already deleted records are not deleted (or counted) again
+    assert user_dao.bulk_delete([user.uuid for user in users]) == 0
+
+
 def test_list(database_session: Session) -> None:
     user_dao = Repository(model=User, session=database_session)
 
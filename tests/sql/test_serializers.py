@@ -0,0 +1,53 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel as PydanticBaseModel
+
+from sanctumlabs_dbkit.sql.serializers import json_deserializer, json_serializer
+
+
+class Payment(PydanticBaseModel):
+    reference: UUID
+    amount: Decimal
+    captured_on: date
+
+
+def test_json_serializer_handles_pydantic_column_data() -> None:
+    serialized = json_serializer(
+        {
+            "reference": UUID("45a09352-4af5-4e46-a20e-29640cfd73dd"),
+            "amount": Decimal("199.99"),
+            "captured_on": date(2024, 3, 1),
+        }
+    )
+
+    assert json_deserializer(serialized) == {
+        "reference": "45a09352-4af5-4e46-a20e-29640cfd73dd",
+        "amount": 199.99,
+        "captured_on": "2024-03-01",
+    }
+
+
+def test_json_serializer_serializes_pydantic_models() -> None:
+    payment = Payment(
+        reference=UUID("45a09352-4af5-4e46-a20e-29640cfd73dd"),
+        amount=Decimal("199.99"),
+        captured_on=date(2024, 3, 1),
+    )
+
+    serialized = json_serializer({"payment": payment})
+
+    assert json_deserializer(serialized) == {
+        "payment": {
+            "reference": "45a09352-4af5-4e46-a20e-29640cfd73dd",
+            "amount": 199.99,
+            "captured_on": "2024-03-01",
+        }
+    }
+
+
+def test_json_serializer_raises_on_unsupported_types() -> None:
+    with pytest.raises(TypeError):
+        json_serializer({"unsupported": object()})
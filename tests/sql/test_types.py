@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, cast
 
 from pydantic import BaseModel as PydanticBaseModel
 from sqlalchemy import JSON, text
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sanctumlabs_dbkit.sql.repository import Repository
@@ -13,6 +14,7 @@ from sanctumlabs_dbkit.sql.types import (
     MutablePydanticModel,
     MutablePydanticModelList,
     PydanticModel,
+    PydanticModelList,
     SerializationOptions,
 )
 
@@ -473,3 +475,103 @@ def test_sqlalchemy_updates_value_in_pydantic_model_list_column_when_model_is_re
     assert cart.products[0].brand == "Kit Kat"
     assert cart.products[0].price == Decimal("2.45")
     assert cart.products[0].is_for_sale
+
+
+def test_pydantic_model_column_skips_validation_on_read_when_trust_db_is_set() -> None:
+    column_type = PydanticModel(
+        SettingsData, serialization_options=SerializationOptions(trust_db=True)
+    )
+
+    settings_data = column_type.process_result_value(
+        {
+            "invoice_email_address": "accounts@sanctumlabs.com",
+            "show_address_on_invoice": False,
+            "invoice_footer_text": None,
+        },
+        sqlite.dialect(),
+    )
+
+    assert isinstance(settings_data, SettingsData)
+    assert settings_data.invoice_email_address == "accounts@sanctumlabs.com"
+    assert not settings_data.show_address_on_invoice
+    assert settings_data.invoice_footer_text is None
+
+    assert column_type.process_result_value(None, sqlite.dialect()) is None
+
+
+def test_mutable_pydantic_model_caches_serialized_dict_until_changed() -> None:
+    column_type = PydanticModel(SettingsData)
+    settings_data = MutablePydanticModel(SettingsData())
+
+    first = column_type.process_bind_param(settings_data, sqlite.dialect())
+    second = column_type.process_bind_param(settings_data, sqlite.dialect())
+
+    assert first is second
+
+    settings_data.show_address_on_invoice = False
+
+    third = column_type.process_bind_param(settings_data, sqlite.dialect())
+
+    assert third is not first
+    assert third == {
+        "invoice_email_address": "foo@bar.com",
+        "show_address_on_invoice": False,
+        "invoice_footer_text": None,
+    }
+
+
+def test_mutable_pydantic_model_ignores_no_op_attribute_writes() -> None:
+    column_type = PydanticModel(SettingsData)
+    settings_data = MutablePydanticModel(SettingsData())
+
+    first = column_type.process_bind_param(settings_data, sqlite.dialect())
+
+    settings_data.invoice_email_address = "foo@bar.com"
+
+    second = column_type.process_bind_param(settings_data, sqlite.dialect())
+
+    assert second is first
+
+    settings_data.invoice_email_address = "bar@baz.com"
+
+    third = column_type.process_bind_param(settings_data, sqlite.dialect())
+
+    assert third is not first
+    assert third == {
+        "invoice_email_address": "bar@baz.com",
+        "show_address_on_invoice": True,
+        "invoice_footer_text": None,
+    }
+
+
+def test_pydantic_model_list_column_skips_validation_on_read_when_trust_db_is_set() -> (
+    None
+):
+    column_type = PydanticModelList(
+        Product, serialization_options=SerializationOptions(trust_db=True)
+    )
+
+    products = column_type.process_result_value(
+        [
+            {
+                "name": "Kit Kat Chunky",
+                "brand": "Kit Kat",
+                "price": Decimal("2.45"),
+                "is_for_sale": True,
+            }
+        ],
+        sqlite.dialect(),
+    )
+
+    assert products is not None
+    assert len(products) == 1
+
+    product = products[0]
+
+    assert isinstance(product, Product)
+    assert product.name == "Kit Kat Chunky"
+    assert product.brand == "Kit Kat"
+    assert product.price == Decimal("2.45")
+    assert product.is_for_sale
+
+    assert column_type.process_result_value(None, sqlite.dialect()) is None